@@ -0,0 +1,22 @@
+# Atomic write-back for the fix_*.py scripts. The new content goes to a temp
+# file in the same directory, which then replaces the original with a single
+# rename. Dev-server watchers (Vite HMR, tsc --watch) see one complete change
+# instead of a truncated file followed by its new content.
+import contextlib
+import os
+import tempfile
+
+def write_bytes(filepath, data):
+    directory = os.path.dirname(filepath) or '.'
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(filepath) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb', buffering=1 << 20) as f:
+            f.write(data)
+        # mkstemp creates the file 0600; keep the original's permissions
+        with contextlib.suppress(FileNotFoundError):
+            os.chmod(tmp, os.stat(filepath).st_mode & 0o7777)
+        os.replace(tmp, filepath)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# Single-pass driver: every challenge file is read once, run through all
+# substitutions in order, and written back only if something changed.
+import atomic_write
+import fix_cache
+import fix_challenges
+import fix_errors
+
+challenge_dir = "src/components/challenges"
+
+# Only the idempotent, directory-wide cleanups belong here. The startTime
+# migrations are deliberately left out: --mode=state, --mode=delete and
+# fix_all_starttime each undo or clash with another, and fix_all_starttime
+# only ever targeted its own four files - run whichever one you need by hand.
+# ChallengeBase props are stripped by fix_challenges.strip_props beforehand.
+TRANSFORMS = [
+    (fix_errors.DESTRUCTURE, '{ onComplete, }'),
+]
+
+def fix_file(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    original = content
+
+    content = fix_challenges.strip_props(content)
+    for pat, rep in TRANSFORMS:
+        content = pat.sub(rep, content)
+
+    if content != original:
+        atomic_write.write_bytes(filepath, content.encode('utf-8'))
+        return True
+    return False
+
+if __name__ == "__main__":
+    fix_cache.run("fix_all", challenge_dir, fix_file, fix_challenges.EXCLUDE)
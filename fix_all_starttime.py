@@ -1,58 +1,54 @@
 #!/usr/bin/env python3
 import os
-import re
+from pathlib import Path
 
-files = [
-    "src/components/challenges/14_ClickPrecision.tsx",
-    "src/components/challenges/17_SimonSays.tsx",
-    "src/components/challenges/18_BalanceGame.tsx",
-    "src/components/challenges/41_ImagePuzzle.tsx",
-]
+import atomic_write
+import regex_cache
 
-for filepath in files:
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Fix: const [startTime] = useState(() => Date.now());
-    # To: const startTimeRef = useRef(0); in useEffect set it
+# const [startTime] = useState(() => Date.now()) -> const startTimeRef = useRef(0)
+PAT_USESTATE = regex_cache.compile(r"const \[startTime\] = useState\(\(\) => Date\.now\(\)\);")
+# Assignments in useEffect
+PAT_ASSIGN = regex_cache.compile(r"\bstartTime = Date\.now\(\);")
+# References - \b keeps an already-converted startTimeRef.current intact
+PAT_ELAPSED = regex_cache.compile(r"Date\.now\(\) - startTime\b")
+# GameContainer challengeId prop
+PAT_CID_PROP = regex_cache.compile(r"challengeId: currentChallenge\.id\.toString\(\),")
+
+if __name__ == "__main__":
+    files = [
+        "src/components/challenges/14_ClickPrecision.tsx",
+        "src/components/challenges/17_SimonSays.tsx",
+        "src/components/challenges/18_BalanceGame.tsx",
+        "src/components/challenges/41_ImagePuzzle.tsx",
+    ]
+
+    for filepath in files:
+        content = Path(filepath).read_text(encoding='utf-8')
+        original = content
     
-    # Replace useState startTime declarations
-    content = re.sub(
-        r"const \[startTime\] = useState\(\(\) => Date\.now\(\)\);",
-        "const startTimeRef = useRef(0);",
-        content
-    )
+        # Fix: const [startTime] = useState(() => Date.now());
+        # To: const startTimeRef = useRef(0); in useEffect set it
     
-    # Fix assignments in useEffect
-    content = re.sub(
-        r"startTime = Date\.now\(\);",
-        "startTimeRef.current = Date.now();",
-        content
-    )
+        # Replace useState startTime declarations
+        content = PAT_USESTATE.sub("const startTimeRef = useRef(0);", content)
     
-    # Fix references
-    content = re.sub(
-        r"Date\.now\(\) - startTime",
-        "Date.now() - startTimeRef.current",
-        content
-    )
+        # Fix assignments in useEffect
+        content = PAT_ASSIGN.sub("startTimeRef.current = Date.now();", content)
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+        # Fix references
+        content = PAT_ELAPSED.sub("Date.now() - startTimeRef.current", content)
     
-    print(f"Fixed: {filepath}")
+        if content != original:
+            atomic_write.write_bytes(filepath, content.encode('utf-8'))
+            print(f"Fixed: {filepath}")
 
-# Fix GameContainer - remove challengeId from props
-filepath = "src/components/GameContainer.tsx"
-with open(filepath, 'r', encoding='utf-8') as f:
-    content = f.read()
+    # Fix GameContainer - remove challengeId from props
+    filepath = "src/components/GameContainer.tsx"
+    content = Path(filepath).read_text(encoding='utf-8')
+    original = content
 
-content = re.sub(
-    r"challengeId: currentChallenge\.id\.toString\(\),",
-    "",
-    content
-)
+    content = PAT_CID_PROP.sub("", content)
 
-with open(filepath, 'w', encoding='utf-8') as f:
-    f.write(content)
-print(f"Fixed: {filepath}")
+    if content != original:
+        atomic_write.write_bytes(filepath, content.encode('utf-8'))
+        print(f"Fixed: {filepath}")
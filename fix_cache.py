@@ -0,0 +1,81 @@
+# Hash cache shared by the fix_*.py scripts. After a run, each script records
+# the SHA-1 of every file it processed; on the next run, files whose content
+# still hashes the same are known to be clean and are skipped. The cache is
+# keyed on the fixer sources too, so editing any fixer invalidates it.
+import glob
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import atomic_write
+
+CACHE_PATH = ".fixcache.json"
+
+_here = os.path.dirname(os.path.abspath(__file__))
+
+def file_hash(filepath):
+    with open(filepath, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def _fixers_hash():
+    h = hashlib.sha1()
+    helpers = [os.path.join(_here, name) for name in ("fix_io.py", "regex_cache.py")]
+    for path in sorted(glob.glob(os.path.join(_here, "fix_*.py")) + helpers):
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+def _load_all():
+    try:
+        with open(CACHE_PATH, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+    if data.get("fixers") != _fixers_hash():
+        return {}
+    return data
+
+def load(name):
+    """Return the {filepath: sha1} map recorded for the named fixer."""
+    return _load_all().get("files", {}).get(name, {})
+
+def save(name, hashes):
+    data = _load_all()
+    data["fixers"] = _fixers_hash()
+    data.setdefault("files", {})[name] = hashes
+    atomic_write.write_bytes(CACHE_PATH, json.dumps(data, indent=2, sort_keys=True).encode('utf-8'))
+
+def run(name, directory, fix, exclude=frozenset(), label="Fixed", unchanged_label=None):
+    """Run ``fix(filepath)`` over the .tsx files in ``directory`` and report.
+
+    Files are fixed concurrently. Each worker hashes its file first and
+    skips it when the hash matches what the named fixer recorded last time;
+    only a file ``fix`` actually rewrote is hashed again. Results are printed
+    in listing order as ``"{label}: {filename}"``, plus ``unchanged_label``
+    lines for files that were checked but needed nothing, if given.
+    """
+    cache = load(name)
+    with os.scandir(directory) as it:
+        entries = [
+            entry for entry in it
+            if entry.name.endswith('.tsx') and entry.name not in exclude
+        ]
+
+    def process(filepath):
+        digest = file_hash(filepath)
+        if cache.get(filepath) == digest:
+            return None, digest
+        fixed = fix(filepath)
+        return fixed, file_hash(filepath) if fixed else digest
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        results = list(ex.map(process, [entry.path for entry in entries]))
+
+    for entry, (fixed, digest) in zip(entries, results):
+        cache[entry.path] = digest
+        if fixed:
+            print(f"{label}: {entry.name}")
+        elif fixed is not None and unchanged_label:
+            print(f"{unchanged_label}: {entry.name}")
+    save(name, cache)
@@ -1,32 +1,213 @@
-import os
-import re
+import atomic_write
+import fix_cache
+import fix_io
 
 challenges_dir = "src/components/challenges"
+EXCLUDE = frozenset({"ChallengeBase.tsx", "Timer.tsx"})
 
-# Find all challenge files
-for filename in os.listdir(challenges_dir):
-    if filename.endswith(".tsx") and filename not in ["ChallengeBase.tsx", "Timer.tsx"]:
-        filepath = os.path.join(challenges_dir, filename)
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Pattern to find and remove challengeId and onComplete from ChallengeBase
-        pattern = r'(<ChallengeBase\s+title="[^"]+"\s+description="[^"]+"\s+)\s*challengeId=\{challengeId\}\s*onComplete=\{onComplete\}\s*(>)'
-        replacement = r'\1\2'
-        
-        new_content = re.sub(pattern, replacement, content)
-        
-        # Also handle cases where they might be on separate lines
-        pattern2 = r'(\s+challengeId=\{challengeId\})\s*'
-        new_content = re.sub(pattern2, '', new_content)
-        
-        pattern3 = r'(\s+onComplete=\{onComplete\})\s*'
-        new_content = re.sub(pattern3, '', new_content)
-        
-        if new_content != content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            print(f"Fixed: {filename}")
-
-print("Done!")
+# Files without any of these cannot match, so they skip the scan entirely
+NEEDLES = (b'challengeId=', b'onComplete=')
+
+# A '/' or '<' that follows one of these words starts a regex literal or JSX,
+# not a division or comparison
+EXPR_KEYWORDS = frozenset({
+    'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void',
+    'throw', 'case', 'do', 'else', 'yield', 'await',
+})
+
+def is_expression_start(content, i, start):
+    """Tell whether an operand, rather than an operator, may begin at content[i].
+
+    Only a preceding identifier, closing bracket or string end makes '/' a
+    division and '<' a comparison; anything else is treated as the start of
+    a regex literal or JSX element.
+    """
+    j = i - 1
+    while j >= start and content[j].isspace():
+        j -= 1
+    if j < start:
+        return True
+    c = content[j]
+    if c.isalnum() or c in '_$':
+        k = j
+        while k >= start and (content[k].isalnum() or content[k] in '_$'):
+            k -= 1
+        return content[k + 1:j + 1] in EXPR_KEYWORDS
+    return c not in ')]"\'`'
+
+def skip_string(content, i):
+    """Return the index just past the JS string literal opening at content[i].
+
+    Returns None if the string is not terminated on the same line.
+    """
+    quote = content[i]
+    n = len(content)
+    i += 1
+    while i < n:
+        c = content[i]
+        if c == '\\':
+            i += 2
+        elif c == quote:
+            return i + 1
+        elif c == '\n':
+            return None
+        else:
+            i += 1
+    return None
+
+def skip_template(content, i):
+    """Return the index just past the template literal opening at content[i].
+
+    ``${...}`` substitutions are skipped as expressions, so quotes and braces
+    inside them cannot end the literal. Returns None if it is unterminated.
+    """
+    n = len(content)
+    i += 1
+    while i < n:
+        c = content[i]
+        if c == '\\':
+            i += 2
+        elif c == '`':
+            return i + 1
+        elif c == '$' and content.startswith('{', i + 1):
+            i = skip_braces(content, i + 1)
+            if i is None:
+                return None
+        else:
+            i += 1
+    return None
+
+def skip_braces(content, i):
+    """Return the index just past the {...} expression opening at content[i].
+
+    Strings, template literals and comments are skipped, so braces inside
+    them are not counted. Returns None when the expression cannot be scanned
+    reliably: it is unterminated, or it holds a regex literal or JSX element,
+    whose contents a brace counter cannot tell apart from code.
+    """
+    start = i
+    depth = 0
+    n = len(content)
+    while i < n:
+        c = content[i]
+        if c == '"' or c == "'":
+            i = skip_string(content, i)
+        elif c == '`':
+            i = skip_template(content, i)
+        elif content.startswith('//', i):
+            end = content.find('\n', i)
+            i = None if end == -1 else end + 1
+        elif content.startswith('/*', i):
+            end = content.find('*/', i + 2)
+            i = None if end == -1 else end + 2
+        elif c == '/' or c == '<':
+            if is_expression_start(content, i, start):
+                return None
+            i += 1
+        elif c == '{':
+            depth += 1
+            i += 1
+        elif c == '}':
+            depth -= 1
+            i += 1
+            if depth == 0:
+                return i
+        else:
+            i += 1
+        if i is None:
+            return None
+    return None
+
+def skip_tag(content, i, props, drops):
+    """Walk the attributes of the opening tag whose name ends at content[i].
+
+    Appends the ``(start, end)`` span of every attribute named in ``props``
+    to ``drops`` and returns the index of the closing ``>`` or ``/>``.
+    Returns None, leaving ``drops`` untouched, if any part of the tag
+    cannot be scanned reliably.
+    """
+    n = len(content)
+    found = []
+    while True:
+        attr_start = i
+        while i < n and content[i].isspace():
+            i += 1
+        if i >= n:
+            return None
+        if content[i] == '>' or content.startswith('/>', i):
+            drops.extend(found)
+            return i
+        if content[i] == '{':
+            # {...spread}
+            i = skip_braces(content, i)
+            if i is None:
+                return None
+            continue
+        name_start = i
+        while i < n and (content[i].isalnum() or content[i] in '_-:'):
+            i += 1
+        name = content[name_start:i]
+        if not name:
+            return None
+        if i < n and content[i] == '=':
+            i += 1
+            if i < n and content[i] == '{':
+                i = skip_braces(content, i)
+            elif i < n and content[i] in '"\'':
+                # JSX attribute strings have no escapes and may span lines
+                end = content.find(content[i], i + 1)
+                i = None if end == -1 else end + 1
+            else:
+                return None
+            if i is None:
+                return None
+        if name in props:
+            found.append((attr_start, i))
+
+def strip_props(content, tag='ChallengeBase', props=('challengeId', 'onComplete')):
+    """Remove ``prop=...`` attributes from every ``<tag ...>`` opening tag.
+
+    Walks each opening tag once, skipping over quoted values and balanced
+    ``{...}`` expressions, so nested braces in a value cannot end the tag
+    early. Each dropped attribute takes its leading whitespace with it. A tag
+    that cannot be scanned reliably is left exactly as it is.
+    """
+    opener = '<' + tag
+    n = len(content)
+    drops = []
+    start = content.find(opener)
+    while start != -1:
+        i = start + len(opener)
+        # <ChallengeBaseFoo is a different tag
+        if i < n and (content[i].isalnum() or content[i] == '_'):
+            start = content.find(opener, i)
+            continue
+        end = skip_tag(content, i, props, drops)
+        start = content.find(opener, i if end is None else end)
+
+    if not drops:
+        return content
+
+    parts = []
+    prev = 0
+    for drop_start, drop_end in drops:
+        parts.append(content[prev:drop_start])
+        prev = drop_end
+    parts.append(content[prev:])
+    return ''.join(parts)
+
+def fix_file(filepath):
+    content = fix_io.read_if_contains(filepath, NEEDLES)
+    if content is None:
+        return False
+    
+    new_content = strip_props(content)
+    
+    if new_content != content:
+        atomic_write.write_bytes(filepath, new_content.encode('utf-8'))
+        return True
+    return False
+
+if __name__ == "__main__":
+    fix_cache.run("fix_challenges", challenges_dir, fix_file, EXCLUDE)
+    print("Done!")
@@ -1,66 +1,44 @@
 #!/usr/bin/env python3
-import os
 import re
 
+import atomic_write
+import fix_cache
+import fix_io
+import regex_cache
+
 challenge_dir = "src/components/challenges"
+EXCLUDE = frozenset({'ChallengeBase.tsx'})
 
-# Pattern to find and remove unused timeLimit and challengeId
-def fix_file(filepath):
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    original = content
-    
-    # Remove unused timeLimit and challengeId from destructuring
-    # Pattern: { onComplete, timeLimit, challengeId, } or similar
-    content = re.sub(
-        r'\{\s*onComplete,\s*\n\s*timeLimit,\s*\n\s*challengeId,\s*\n\s*\}',
-        '{ onComplete, }',
-        content
-    )
-    
-    content = re.sub(
-        r'\{\s*onComplete,\s*\n\s*timeLimit,\s*\n\s*\}',
-        '{ onComplete, }',
-        content
-    )
-    
-    content = re.sub(
-        r'\{\s*onComplete,\s*\n\s*challengeId,\s*\n\s*\}',
-        '{ onComplete, }',
-        content
-    )
-    
-    # Single line versions
-    content = re.sub(
-        r'\{\s*onComplete,\s*timeLimit,\s*challengeId,\s*\}',
-        '{ onComplete, }',
-        content
+# Remove unused timeLimit and challengeId from destructuring
+# Pattern: { onComplete, timeLimit, challengeId, } or similar, on one line or
+# spread over several (\s also matches newlines)
+# Whitespace runs are possessive (*+) so a near-miss fails straight away
+# instead of backtracking through every split of the whitespace. re only
+# understands possessive quantifiers from Python 3.11, so older interpreters
+# fall back to the equivalent greedy pattern.
+try:
+    DESTRUCTURE = regex_cache.compile(
+        r'\{\s*+onComplete,\s*+(?:timeLimit,\s*+(?:challengeId,\s*+)?|challengeId,\s*+)\}'
     )
-    
-    content = re.sub(
-        r'\{\s*onComplete,\s*timeLimit,\s*\}',
-        '{ onComplete, }',
-        content
+except re.error:
+    DESTRUCTURE = regex_cache.compile(
+        r'\{\s*onComplete,\s*(?:timeLimit,\s*(?:challengeId,\s*)?|challengeId,\s*)\}'
     )
+# Files without any of these cannot match, so they skip the regex entirely
+NEEDLES = (b'timeLimit', b'challengeId')
+
+# Pattern to find and remove unused timeLimit and challengeId
+def fix_file(filepath):
+    content = fix_io.read_if_contains(filepath, NEEDLES)
+    if content is None:
+        return False
     
-    content = re.sub(
-        r'\{\s*onComplete,\s*challengeId,\s*\}',
-        '{ onComplete, }',
-        content
-    )
+    content, count = DESTRUCTURE.subn('{ onComplete, }', content)
     
-    if content != original:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+    if count:
+        atomic_write.write_bytes(filepath, content.encode('utf-8'))
         return True
     return False
 
-# Get all challenge files
-for filename in os.listdir(challenge_dir):
-    if filename.endswith('.tsx') and filename not in ['ChallengeBase.tsx']:
-        filepath = os.path.join(challenge_dir, filename)
-        if fix_file(filepath):
-            print(f"Fixed: {filename}")
-        else:
-            print(f"No changes: {filename}")
+if __name__ == "__main__":
+    fix_cache.run("fix_errors", challenge_dir, fix_file, EXCLUDE, unchanged_label="No changes")
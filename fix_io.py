@@ -0,0 +1,19 @@
+# Read side shared by the fix_*.py scripts (writes go through atomic_write).
+import mmap
+import os
+
+def read_if_contains(filepath, needles):
+    """Return the decoded file content, or None if no needle occurs in it.
+
+    The file is memory-mapped and searched as bytes first, so files without
+    any of ``needles`` (a tuple of bytes) are never decoded. mmap's ``in``
+    only tests single bytes, hence find().
+    """
+    with open(filepath, 'rb') as f:
+        # Empty files cannot be mapped, and have nothing to fix anyway
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if not any(mm.find(n) != -1 for n in needles):
+                return None
+            return mm[:].decode('utf-8')
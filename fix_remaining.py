@@ -1,162 +1,127 @@
 #!/usr/bin/env python3
 import os
-import re
+from pathlib import Path
+
+import atomic_write
+import regex_cache
+
+PAT_USESTATE_IMPORT = regex_cache.compile(r"import.*useState.*from 'react';")
+
+# Challenge file cleanups, matched in a single pass: each alternative is a
+# named group and the replacement is looked up by whichever group matched.
+PROPS = r"(?P<props>const \{ onComplete, timeLimit, challengeId, \} = props;)"
+# The whole line with its indentation, but not the preceding newline
+STARTTIME_REF = r"(?P<sref>[ \t]*const startTimeRef = useRef<number>\(Date\.now\(\)\);\n)"
+INDEX_PARAM = r"(?P<idx>\(_, index\) =>)"
+REPLACEMENTS = {
+    "props": "const { onComplete, } = props;",
+    "sref": "",
+    "idx": "(_) =>",
+}
+UNIFIED = regex_cache.compile("|".join([PROPS, STARTTIME_REF]))
+UNIFIED_IDX = regex_cache.compile("|".join([PROPS, STARTTIME_REF, INDEX_PARAM]))
+
+# Plain literals, replaced with str.replace
+RATING = "const rating = getRating(moves);"
+PLACEHOLDER = "const PlaceholderChallenge = "
+CATCH_E = "} catch (e) {"
+
+PAT_EMPTY_CATCH = regex_cache.compile(r"\} catch \(_\) \{\s*\}")
 
 # Fix GameContainer - remove unused useState
 filepath = "src/components/GameContainer.tsx"
-with open(filepath, 'r') as f:
-    content = f.read()
+content = Path(filepath).read_text(encoding='utf-8')
+original = content
 
-content = re.sub(
-    r"import.*useState.*from 'react';",
-    lambda m: m.group(0).replace(", useState", ""),
-    content
-)
+content = PAT_USESTATE_IMPORT.sub(lambda m: m.group(0).replace(", useState", ""), content)
 
-with open(filepath, 'w') as f:
-    f.write(content)
-print(f"Fixed: {filepath}")
+if content != original:
+    atomic_write.write_bytes(filepath, content.encode('utf-8'))
+    print(f"Fixed: {filepath}")
 
 # Fix 14_ClickPrecision - remove unused timeLimit, challengeId, startTimeRef
 filepath = "src/components/challenges/14_ClickPrecision.tsx"
-with open(filepath, 'r') as f:
-    content = f.read()
-
-# Remove these patterns
-content = re.sub(
-    r"const { onComplete, timeLimit, challengeId, } = props;",
-    "const { onComplete, } = props;",
-    content
-)
-
-content = re.sub(
-    r"\s*const startTimeRef = useRef<number>\(Date\.now\(\)\);\n",
-    "",
-    content
-)
-
-with open(filepath, 'w') as f:
-    f.write(content)
-print(f"Fixed: {filepath}")
+content = Path(filepath).read_text(encoding='utf-8')
+original = content
+
+content = UNIFIED.sub(lambda m: REPLACEMENTS[m.lastgroup], content)
+
+if content != original:
+    atomic_write.write_bytes(filepath, content.encode('utf-8'))
+    print(f"Fixed: {filepath}")
 
 # Fix 17_SimonSays
 filepath = "src/components/challenges/17_SimonSays.tsx"
-with open(filepath, 'r') as f:
-    content = f.read()
+content = Path(filepath).read_text(encoding='utf-8')
+original = content
 
-content = re.sub(
-    r"const { onComplete, timeLimit, challengeId, } = props;",
-    "const { onComplete, } = props;",
-    content
-)
+content = UNIFIED.sub(lambda m: REPLACEMENTS[m.lastgroup], content)
 
-content = re.sub(
-    r"\s*const startTimeRef = useRef<number>\(Date\.now\(\)\);\n",
-    "",
-    content
-)
-
-with open(filepath, 'w') as f:
-    f.write(content)
-print(f"Fixed: {filepath}")
+if content != original:
+    atomic_write.write_bytes(filepath, content.encode('utf-8'))
+    print(f"Fixed: {filepath}")
 
 # Fix 18_BalanceGame
 filepath = "src/components/challenges/18_BalanceGame.tsx"
-with open(filepath, 'r') as f:
-    content = f.read()
+content = Path(filepath).read_text(encoding='utf-8')
+original = content
 
-content = re.sub(
-    r"\s*const startTimeRef = useRef<number>\(Date\.now\(\)\);\n",
-    "",
-    content
-)
+content = UNIFIED.sub(lambda m: REPLACEMENTS[m.lastgroup], content)
 
-with open(filepath, 'w') as f:
-    f.write(content)
-print(f"Fixed: {filepath}")
+if content != original:
+    atomic_write.write_bytes(filepath, content.encode('utf-8'))
+    print(f"Fixed: {filepath}")
 
 # Fix 41_ImagePuzzle
 filepath = "src/components/challenges/41_ImagePuzzle.tsx"
-with open(filepath, 'r') as f:
-    content = f.read()
-
-content = re.sub(
-    r"const { onComplete, timeLimit, challengeId, } = props;",
-    "const { onComplete, } = props;",
-    content
-)
-
-content = re.sub(
-    r"\s*const startTimeRef = useRef<number>\(Date\.now\(\)\);\n",
-    "",
-    content
-)
-
-# Remove unused index parameter
-content = re.sub(
-    r"\(_, index\) =>",
-    "(_) =>",
-    content
-)
-
-with open(filepath, 'w') as f:
-    f.write(content)
-print(f"Fixed: {filepath}")
+content = Path(filepath).read_text(encoding='utf-8')
+original = content
+
+# Also removes the unused index parameter
+content = UNIFIED_IDX.sub(lambda m: REPLACEMENTS[m.lastgroup], content)
+
+if content != original:
+    atomic_write.write_bytes(filepath, content.encode('utf-8'))
+    print(f"Fixed: {filepath}")
 
 # Fix 15_MemoryMatch - remove rating variable
 filepath = "src/components/challenges/15_MemoryMatch.tsx"
-with open(filepath, 'r') as f:
-    content = f.read()
+content = Path(filepath).read_text(encoding='utf-8')
+original = content
 
-content = re.sub(
-    r"const rating = getRating\(moves\);",
-    "getRating(moves);",
-    content
-)
+content = content.replace(RATING, "getRating(moves);")
 
-with open(filepath, 'w') as f:
-    f.write(content)
-print(f"Fixed: {filepath}")
+if content != original:
+    atomic_write.write_bytes(filepath, content.encode('utf-8'))
+    print(f"Fixed: {filepath}")
 
 # Fix utils
 filepath = "src/utils/challengeRegistry.ts"
-with open(filepath, 'r') as f:
-    content = f.read()
+content = Path(filepath).read_text(encoding='utf-8')
+original = content
 
-content = re.sub(
-    r"const PlaceholderChallenge = ",
-    "// const PlaceholderChallenge = ",
-    content
-)
+content = content.replace(PLACEHOLDER, "// const PlaceholderChallenge = ")
 
-with open(filepath, 'w') as f:
-    f.write(content)
-print(f"Fixed: {filepath}")
+if content != original:
+    atomic_write.write_bytes(filepath, content.encode('utf-8'))
+    print(f"Fixed: {filepath}")
 
 filepath = "src/utils/debug.ts"
-with open(filepath, 'r') as f:
-    content = f.read()
+content = Path(filepath).read_text(encoding='utf-8')
+original = content
 
-content = re.sub(
-    r"} catch \(e\) {",
-    "} catch (_) {",
-    content
-)
+content = content.replace(CATCH_E, "} catch (_) {")
 
-with open(filepath, 'w') as f:
-    f.write(content)
-print(f"Fixed: {filepath}")
+if content != original:
+    atomic_write.write_bytes(filepath, content.encode('utf-8'))
+    print(f"Fixed: {filepath}")
 
 filepath = "src/utils/safeRunner.ts"
-with open(filepath, 'r') as f:
-    content = f.read()
-
-content = re.sub(
-    r"\} catch \(_\) \{\s*\}",
-    "} catch (_) {\n    // Ignore error\n  }",
-    content
-)
-
-with open(filepath, 'w') as f:
-    f.write(content)
-print(f"Fixed: {filepath}")
+content = Path(filepath).read_text(encoding='utf-8')
+original = content
+
+content = PAT_EMPTY_CATCH.sub("} catch (_) {\n    // Ignore error\n  }", content)
+
+if content != original:
+    atomic_write.write_bytes(filepath, content.encode('utf-8'))
+    print(f"Fixed: {filepath}")
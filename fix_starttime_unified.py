@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# startTime fixes for the challenge files, one transformation per run:
+#   --mode=state   useRef<number>(Date.now()) -> useState(() => Date.now())
+#   --mode=delete  drop the useRef<number>(Date.now()) line altogether
+# state and delete both act on the useRef line, so running both over the same
+# tree only ever does the first one's work - pick the mode you want instead.
+# fix_date_now.py and fix_starttime.py are shims for --mode=state/--mode=delete.
+# The useState -> useRef(0) migration stays in fix_all_starttime.py, which only
+# targets the files it was written for.
+import argparse
+import mmap
+import os
+
+import atomic_write
+import fix_cache
+import fix_io
+
+challenge_dir = "src/components/challenges"
+
+# const startTimeRef = useRef<number>(Date.now()) -> const [startTime] = useState(() => Date.now())
+# Both are plain literals, so str.replace is enough - no regex needed
+USEREF = 'const startTimeRef = useRef<number>(Date.now());'
+REF = 'startTimeRef.current'
+# Files without any of these cannot match, so they skip the replacements
+STATE_NEEDLES = (b'startTimeRef',)
+
+def fix_date_now(filepath):
+    content = fix_io.read_if_contains(filepath, STATE_NEEDLES)
+    if content is None:
+        return False
+    
+    # Both replacements are shorter than what they replace, so the length
+    # alone tells whether anything changed - no copy of the original needed
+    length = len(content)
+    
+    content = content.replace(USEREF, 'const [startTime] = useState(() => Date.now());')
+    content = content.replace(REF, 'startTime')
+    
+    if len(content) != length:
+        atomic_write.write_bytes(filepath, content.encode('utf-8'))
+        return True
+    return False
+
+USEREF_LINE = b'const startTimeRef = useRef<number>(Date.now());\n'
+
+def fix_starttime(filepath):
+    """Delete every ``const startTimeRef = useRef<number>(Date.now());`` line.
+
+    The file is patched in place through a writable mapping: each match is
+    removed by shifting the tail of the file down over it, and the file is
+    truncated to its new length at the end. No decoded copy of the file is
+    ever built.
+    """
+    with open(filepath, 'r+b') as f:
+        length = os.fstat(f.fileno()).st_size
+        # Empty files cannot be mapped, and have nothing to fix anyway
+        if length == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0) as mm:
+            pos = mm.find(USEREF_LINE)
+            if pos == -1:
+                return False
+            while pos != -1:
+                # Take the line's indentation with it
+                start = pos
+                while start > 0 and mm[start - 1] in b' \t':
+                    start -= 1
+                end = pos + len(USEREF_LINE)
+                mm.move(start, end, length - end)
+                length -= end - start
+                pos = mm.find(USEREF_LINE, start, length)
+            mm.flush()
+        f.truncate(length)
+    return True
+
+MODES = {
+    'state': (fix_date_now, "Fixed Date.now()"),
+    'delete': (fix_starttime, "Fixed startTimeRef"),
+}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fix startTime handling in the challenge files.")
+    parser.add_argument('--mode', choices=sorted(MODES), required=True)
+    args = parser.parse_args(argv)
+    fix, label = MODES[args.mode]
+    fix_cache.run(f"fix_starttime_unified:{args.mode}", challenge_dir, fix, label=label)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+# Shared compiled-pattern cache for the fix_*.py scripts. Unlike re's own
+# cache, which is bounded and evicts old entries, this one keeps every
+# pattern, so scripts driven from one process (see fix_all.py) compile each
+# pattern only once.
+import functools
+import re
+
+_c = functools.lru_cache(maxsize=None)(re.compile)
+
+def compile(pattern, flags=0):
+    return _c(pattern, flags)
@@ -0,0 +1,85 @@
+import unittest
+
+from fix_challenges import strip_props
+
+
+class StripPropsTest(unittest.TestCase):
+    def test_strips_inline_props(self):
+        src = '<ChallengeBase title="T" description="D" challengeId={challengeId} onComplete={onComplete}>'
+        self.assertEqual(strip_props(src), '<ChallengeBase title="T" description="D">')
+
+    def test_strips_props_on_separate_lines(self):
+        src = (
+            '    <ChallengeBase\n'
+            '      title="T"\n'
+            '      description="D"\n'
+            '      challengeId={challengeId}\n'
+            '      onComplete={onComplete}\n'
+            '    >\n'
+        )
+        expected = (
+            '    <ChallengeBase\n'
+            '      title="T"\n'
+            '      description="D"\n'
+            '    >\n'
+        )
+        self.assertEqual(strip_props(src), expected)
+
+    def test_leaves_other_tags_alone(self):
+        src = '<Foo onComplete={onComplete} /><ChallengeBaseX onComplete={y}>'
+        self.assertEqual(strip_props(src), src)
+
+    def test_nested_braces_and_spread(self):
+        src = '<ChallengeBase {...rest} onComplete={() => f({ a: { b: 1 } })} title="T">'
+        self.assertEqual(strip_props(src), '<ChallengeBase {...rest} title="T">')
+
+    def test_escaped_quote_in_string(self):
+        src = '<ChallengeBase title="a" onComplete={() => f("a\\"}")} challengeId={id} description="d">'
+        self.assertEqual(strip_props(src), '<ChallengeBase title="a" description="d">')
+
+    def test_block_comment(self):
+        src = '<ChallengeBase title="a" onComplete={x /* } */} description="d">'
+        self.assertEqual(strip_props(src), '<ChallengeBase title="a" description="d">')
+
+    def test_line_comment(self):
+        src = '<ChallengeBase title="a" onComplete={x // }\n} description="d">'
+        self.assertEqual(strip_props(src), '<ChallengeBase title="a" description="d">')
+
+    def test_template_substitution(self):
+        src = '<ChallengeBase title="a" onComplete={() => f(`x${"}" + `${"`"}`}`)} description="d">'
+        self.assertEqual(strip_props(src), '<ChallengeBase title="a" description="d">')
+
+    def test_attribute_string_has_no_escapes(self):
+        src = '<ChallengeBase title="a\\" onComplete={x} description="d">'
+        self.assertEqual(strip_props(src), '<ChallengeBase title="a\\" description="d">')
+
+    def test_division_is_not_a_regex(self):
+        src = '<ChallengeBase title="a" onComplete={() => f(a / 2, b[0] / c)} description="d">'
+        self.assertEqual(strip_props(src), '<ChallengeBase title="a" description="d">')
+
+    def test_regex_literal_leaves_tag_unchanged(self):
+        src = '<ChallengeBase title="a" onComplete={() => /}"/.test(s)} challengeId={id}>'
+        self.assertEqual(strip_props(src), src)
+
+    def test_jsx_in_expression_leaves_tag_unchanged(self):
+        src = "<ChallengeBase title=\"a\" onComplete={() => show(<p>don't }</p>)} challengeId={id}>"
+        self.assertEqual(strip_props(src), src)
+
+    def test_unterminated_tag_left_unchanged(self):
+        src = '<ChallengeBase title="a" onComplete={() => f("}'
+        self.assertEqual(strip_props(src), src)
+
+    def test_ambiguous_tag_does_not_block_later_tags(self):
+        src = (
+            '<ChallengeBase onComplete={() => /x/.test(s)} challengeId={id}>'
+            '<ChallengeBase title="b" challengeId={id}>'
+        )
+        expected = (
+            '<ChallengeBase onComplete={() => /x/.test(s)} challengeId={id}>'
+            '<ChallengeBase title="b">'
+        )
+        self.assertEqual(strip_props(src), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()